@@ -1,43 +1,66 @@
-import argparse
 import sys
-from pathlib import Path
 
 from .generators import generate_tfvars, generate_env
 from .errors import CellSpecError
 from .parser import parse_cell_spec
 
+_USAGE = """\
+usage: cellcli [-h] [--input INPUT] [--out-prefix OUT_PREFIX]
 
-def build_arg_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        description="Generate .tfvars and .env from a Cell spec markdown file"
-    )
+Generate .tfvars and .env from a Cell spec markdown file
+
+options:
+  -h, --help                show this help message and exit
+  -i, --input INPUT         Path to cell spec markdown file
+  -o, --out-prefix PREFIX   Output file prefix, for example 'examples/icc-01'"""
 
-    #cli step 1: accept command line arguments for input md, output prefix
-    parser.add_argument(
-        "--input",
-        "-i",
-        type=str,
-        help="Path to cell spec markdown file",
-        default="examples/cell-spec.md",
-    )
 
-    parser.add_argument(
-        "--out-prefix",
-        "-o",
-        type=str,
-        help="Output file prefix, for example 'examples/icc-01'",
-        default="examples/icc-01",
-    )
+def parse_argv(argv: list[str]) -> tuple[str, str]:
+    """Minimal flag walk over argv - two flags do not justify the cost of
+    importing and configuring argparse on every invocation."""
 
-    return parser
+    #cli step 1: accept command line arguments for input md, output prefix
+    input_path = "examples/cell-spec.md"
+    out_prefix = "examples/icc-01"
+
+    args = iter(argv[1:])
+    for arg in args:
+        if arg in ("-i", "--input"):
+            input_path = _flag_value(arg, args)
+        elif arg.startswith("--input="):
+            input_path = arg.split("=", 1)[1]
+        elif arg in ("-o", "--out-prefix"):
+            out_prefix = _flag_value(arg, args)
+        elif arg.startswith("--out-prefix="):
+            out_prefix = arg.split("=", 1)[1]
+        elif arg in ("-h", "--help"):
+            print(_USAGE)
+            sys.exit(0)
+        else:
+            print(f"[cell-spec-cli] Unknown argument: {arg}", file=sys.stderr)
+            print(_USAGE, file=sys.stderr)
+            sys.exit(2)
+
+    return input_path, out_prefix
+
+
+def _flag_value(flag: str, args) -> str:
+    try:
+        return next(args)
+    except StopIteration:
+        print(f"[cell-spec-cli] Missing value for {flag}", file=sys.stderr)
+        sys.exit(2)
 
 
 def main() -> None:
-    parser = build_arg_parser()
-    args = parser.parse_args()
+    #deferred import: only the CLI entrypoint needs pathlib, so library
+    #consumers of this module do not pay for it at import time
+    from pathlib import Path
+
+    input_path, out_prefix_arg = parse_argv(sys.argv)
 
-    spec_path = Path(args.input)
-    out_prefix = Path(args.out_prefix)
+    spec_path = Path(input_path)
+    out_prefix = Path(out_prefix_arg)
     out_prefix.parent.mkdir(parents=True, exist_ok=True)
 
     try:
@@ -61,8 +84,11 @@ def main() -> None:
 
     try:
         #cli step 4: write results to xyz.tfvars and xyz.env
-        tfvars_path.write_text(tfvars_content, encoding="utf8")
-        env_path.write_text(env_content, encoding="utf8")
+        #single loop over both outputs; buffer sized to the content so
+        #each file goes out in one write syscall
+        for out_path, content in ((tfvars_path, tfvars_content), (env_path, env_content)):
+            with open(out_path, "w", encoding="utf8", buffering=len(content) + 1) as f:
+                f.write(content)
     except OSError as exc:
         print(f"[cell-spec-cli] Failed to write output files: {exc}", file=sys.stderr)
         sys.exit(3)
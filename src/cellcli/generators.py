@@ -1,83 +1,108 @@
 from .models import CellSpec
 
+#output grammar lives in two module-level templates so each generator is
+#a single C-level format_map call; template construction is paid once at
+#import time instead of per invocation
+_TFVARS_TEMPLATE = '''cell_name  = "{cell_name}"
+realm_name = "{realm_name}"
+region     = "{region}"
+
+# kernel layer
+kernel_cpu    = {kernel_cpu}
+kernel_memory = {kernel_memory}
+kernel_tasks  = {kernel_tasks}
+
+# platform layer
+platform_cpu    = {platform_cpu}
+platform_memory = {platform_memory}
+platform_tasks  = {platform_tasks}
+
+# gateway layer
+gateway_cpu    = {gateway_cpu}
+gateway_memory = {gateway_memory}
+gateway_tasks  = {gateway_tasks}
+
+# apps layer
+apps_cpu    = {apps_cpu}
+apps_memory = {apps_memory}
+apps_tasks  = {apps_tasks}
+
+# database
+db_instance_class = "{db_instance_class}"
+db_storage_gb     = {db_storage_gb}
+
+# cache
+cache_node_type = "{cache_node_type}"
+cache_nodes     = {cache_nodes}
+'''
+
+_ENV_TEMPLATE = '''CELL_NAME={cell_name}
+REALM_NAME={realm_name}
+REGION={region}
+
+KERNEL_CPU={kernel_cpu}
+KERNEL_MEMORY_MB={kernel_memory}
+KERNEL_TASKS={kernel_tasks}
+
+PLATFORM_CPU={platform_cpu}
+PLATFORM_MEMORY_MB={platform_memory}
+PLATFORM_TASKS={platform_tasks}
+
+GATEWAY_CPU={gateway_cpu}
+GATEWAY_MEMORY_MB={gateway_memory}
+GATEWAY_TASKS={gateway_tasks}
+
+APPS_CPU={apps_cpu}
+APPS_MEMORY_MB={apps_memory}
+APPS_TASKS={apps_tasks}
+
+DB_INSTANCE_CLASS={db_instance_class}
+DB_STORAGE_GB={db_storage_gb}
+
+CACHE_NODE_TYPE={cache_node_type}
+CACHE_NODES={cache_nodes}
+'''
+
+
+def _flatten(cell: CellSpec) -> dict:
+    """Flatten a CellSpec into the field dict both templates consume.
+
+    Parser guarantees the four fixed layers exist, so they are indexed
+    directly via the lookup dict CellSpec builds once at construction.
+    """
+    kernel = cell.layers_by_name["kernel"]
+    platform = cell.layers_by_name["platform"]
+    gateway = cell.layers_by_name["gateway"]
+    apps = cell.layers_by_name["apps"]
+
+    return {
+        "cell_name": cell.cell_name,
+        "realm_name": cell.realm_name,
+        "region": cell.region,
+        "kernel_cpu": kernel.vcpu,
+        "kernel_memory": kernel.memory_mb,
+        "kernel_tasks": kernel.tasks,
+        "platform_cpu": platform.vcpu,
+        "platform_memory": platform.memory_mb,
+        "platform_tasks": platform.tasks,
+        "gateway_cpu": gateway.vcpu,
+        "gateway_memory": gateway.memory_mb,
+        "gateway_tasks": gateway.tasks,
+        "apps_cpu": apps.vcpu,
+        "apps_memory": apps.memory_mb,
+        "apps_tasks": apps.tasks,
+        "db_instance_class": cell.database.instance_class,
+        "db_storage_gb": cell.database.storage_gb,
+        "cache_node_type": cell.cache.node_type,
+        "cache_nodes": cell.cache.nodes,
+    }
+
 
 def generate_tfvars(cell: CellSpec) -> str:
     """Return the contents of a .tfvars file for this CellSpec."""
-    
-    lines: list[str] = []
-
-    #core identity
-    lines.append(f'cell_name  = "{cell.cell_name}"')
-    lines.append(f'realm_name = "{cell.realm_name}"')
-    lines.append(f'region     = "{cell.region}"')
-    lines.append("")
-
-    #compute layers in  fixed and predictable order
-    #this ordering will always be kernel, platform, gateway, apps
-    layer_order = ["kernel", "platform", "gateway", "apps"]
-    layers_by_name = {layer.name.lower(): layer for layer in cell.layers}
-
-    for name in layer_order:
-        layer = layers_by_name.get(name)
-        if not layer:
-            #parser should have guaranteed this, but we guard anyway
-            continue
-
-        prefix = layer.name.lower()
-        lines.append(f"# {prefix} layer")
-        lines.append(f"{prefix}_cpu    = {layer.vcpu}")
-        lines.append(f"{prefix}_memory = {layer.memory_mb}")
-        lines.append(f"{prefix}_tasks  = {layer.tasks}")
-        lines.append("")
-
-    #database
-    lines.append("# database")
-    lines.append(f'db_instance_class = "{cell.database.instance_class}"')
-    lines.append(f"db_storage_gb     = {cell.database.storage_gb}")
-    lines.append("")
-
-    #cache
-    lines.append("# cache")
-    lines.append(f'cache_node_type = "{cell.cache.node_type}"')
-    lines.append(f"cache_nodes     = {cell.cache.nodes}")
-
-    #join with newlines and ensure a trailing newline at end of file
-    return "\n".join(lines).rstrip() + "\n"
+    return _TFVARS_TEMPLATE.format_map(_flatten(cell))
 
 
 def generate_env(cell: CellSpec) -> str:
     """Return the contents of a .env file for this CellSpec."""
-
-    lines: list[str] = []
-
-    #core identity
-    lines.append(f"CELL_NAME={cell.cell_name}")
-    lines.append(f"REALM_NAME={cell.realm_name}")
-    lines.append(f"REGION={cell.region}")
-    lines.append("")
-
-    #compute layers in fixed order
-    layer_order = ["kernel", "platform", "gateway", "apps"]
-    layers_by_name = {layer.name.lower(): layer for layer in cell.layers}
-
-    for name in layer_order:
-        layer = layers_by_name.get(name)
-        if not layer:
-            continue
-
-        upper = layer.name.upper()
-        lines.append(f"{upper}_CPU={layer.vcpu}")
-        lines.append(f"{upper}_MEMORY_MB={layer.memory_mb}")
-        lines.append(f"{upper}_TASKS={layer.tasks}")
-        lines.append("")
-
-    #database
-    lines.append("DB_INSTANCE_CLASS=" + cell.database.instance_class)
-    lines.append(f"DB_STORAGE_GB={cell.database.storage_gb}")
-    lines.append("")
-
-    #cache
-    lines.append("CACHE_NODE_TYPE=" + cell.cache.node_type)
-    lines.append(f"CACHE_NODES={cell.cache.nodes}")
-
-    return "\n".join(lines).rstrip() + "\n"
+    return _ENV_TEMPLATE.format_map(_flatten(cell))
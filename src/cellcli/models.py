@@ -1,8 +1,11 @@
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Dict, List
 
 
-@dataclass
+#slots=True drops the per-instance __dict__ (smaller objects, C-level
+#descriptor attribute access in the hot loops); frozen=True makes the
+#parsed spec safely shareable
+@dataclass(slots=True, frozen=True)
 class LayerSpec: #1 compute layer with these fields
     name: str
     vcpu: int
@@ -10,19 +13,19 @@ class LayerSpec: #1 compute layer with these fields
     tasks: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DatabaseSpec: #database instance class and storage size
     instance_class: str
     storage_gb: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CacheSpec: #define cache node type and node count
     node_type: str
     nodes: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CellSpec: #top level object
     cell_name: str
     realm_name: str
@@ -30,3 +33,11 @@ class CellSpec: #top level object
     layers: List[LayerSpec] #all compute layers
     database: DatabaseSpec
     cache: CacheSpec
+    #lookup table built once here so generators do not rebuild it per call;
+    #parser already lowercases layer names so keys need no normalization
+    layers_by_name: Dict[str, LayerSpec] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        #object.__setattr__ is the standard escape hatch for populating
+        #derived fields on a frozen dataclass
+        object.__setattr__(self, "layers_by_name", {layer.name: layer for layer in self.layers})
@@ -1,18 +1,52 @@
 from __future__ import annotations
 
+import functools
+import re
+import sys
 from pathlib import Path
 from typing import List, Dict
 
 from .models import CellSpec, LayerSpec, DatabaseSpec, CacheSpec
 from .errors import CellSpecError
 
+# metadata lines match in one precompiled C-level regex call instead of
+# the lower()+startswith+split/strip sequence per candidate line
+_META_RE = re.compile(r"^(realm|region)\s*:\s*(.+?)\s*$", re.IGNORECASE)
+
+# regex group 1 (lowercased) → accumulator key
+_META_KEYS = {
+    "realm": "realm_name",
+    "region": "region",
+}
+
+# fixed 4-layer architecture; interned so parsed names (also interned
+# below) compare by pointer in the dict/set lookups on the validation path
+_REQUIRED_LAYERS = frozenset(map(sys.intern, ("kernel", "platform", "gateway", "apps")))
+
+# completion bits for the scan loop - once every extractable piece has
+# been seen there is nothing left in the file worth scanning
+_HAVE_TITLE = 1
+_HAVE_REALM = 2
+_HAVE_REGION = 4
+_HAVE_LAYERS = 8
+_HAVE_DB = 16
+_HAVE_CACHE = 32
+_HAVE_ALL = 63
+
+# accumulator key → completion bit for metadata lines
+_META_BITS = {
+    "realm_name": _HAVE_REALM,
+    "region": _HAVE_REGION,
+}
+
 
 def parse_cell_spec(path: Path) -> CellSpec:
     """
     Main parser entrypoint. Reads markdown file and converts to CellSpec object.
 
-    Strategy: single-pass line-by-line scan, extracting metadata and delegating
-    table parsing to helper functions. Two-pass validation (structural then numeric).
+    Thin wrapper that stats the file and delegates to the memoized parser,
+    so repeated invocations on an unchanged file (same path, mtime, size)
+    reuse the already-built CellSpec. Safe because CellSpec is frozen.
 
     Returns: fully validated CellSpec object ready for generation
     Raises: CellSpecError if file missing, malformed, or validation fails
@@ -21,57 +55,91 @@ def parse_cell_spec(path: Path) -> CellSpec:
     if not path.exists():
         raise CellSpecError(f"Spec file not found: {path}")
 
-    # read entire file into memory, normalize line endings
-    text = path.read_text(encoding="utf8")
-    lines = [line.rstrip("\n") for line in text.splitlines()]
+    st = path.stat()
+    return _parse_cell_spec_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_cell_spec_cached(path_str: str, mtime_ns: int, size: int) -> CellSpec:
+    """
+    Memoized parse body. mtime_ns/size are cache-key components only - a
+    touched or edited file misses the cache and is re-read from disk.
+
+    Strategy: single-pass line-by-line scan, extracting metadata and delegating
+    table parsing to helper functions. Two-pass validation (structural then numeric).
+    """
+    path = Path(path_str)
+
+    # read through an open handle in one pass; splitlines drops the
+    # terminators so the raw text is released as soon as the list exists.
+    # lines are stripped here exactly once - the scan loop and the table
+    # walker revisit entries without paying a fresh strip() allocation
+    with path.open("r", encoding="utf8") as f:
+        lines = [line.strip() for line in f.read().splitlines()]
 
     # accumulators for parsed data - metadata as optionals, collections as empties
     cell_name: str | None = None
-    realm_name: str | None = None
-    region: str | None = None
+    metadata: Dict[str, str] = {}
 
     layers: List[LayerSpec] = []
     db_settings: Dict[str, str] = {}
     cache_settings: Dict[str, str] = {}
 
     # manual line iteration - helpers update index to skip consumed lines
+    # 'have' tracks which pieces were extracted; the loop stops as soon as
+    # all bits are set instead of walking trailing lines for nothing
     i = 0
     n = len(lines)
+    have = 0
 
-    while i < n:
-        line = lines[i].strip()
+    while i < n and have != _HAVE_ALL:
+        line = lines[i]
+
+        # fast path: blank lines and stray table rows are by far the most
+        # common unmatched lines and can skip every check below
+        if not line or line.startswith("|"):
+            i += 1
+            continue
+
+        # lowercase only the first 17 chars ("## compute layers" is the
+        # longest header we match) - keeps the per-line allocation O(1)
+        # instead of O(line length) for long unrelated lines
+        head = line[:17].lower()
 
         # extract cell name from title line: "# icc-01 Cell" → "icc-01"
         if line.startswith("# "):
             cell_name = _parse_cell_name_from_title(line)
+            have |= _HAVE_TITLE
             i += 1
             continue
 
         # extract metadata from simple key-value lines
-        # split on first colon, take everything after as value
-        if line.lower().startswith("realm:"):
-            realm_name = line.split(":", 1)[1].strip()
-            i += 1
-            continue
-
-        if line.lower().startswith("region:"):
-            region = line.split(":", 1)[1].strip()
+        # the regex captures the trimmed value directly, no split/strip dance
+        m = _META_RE.match(line)
+        if m:
+            key = _META_KEYS[m.group(1).lower()]
+            metadata[key] = m.group(2)
+            have |= _META_BITS[key]
             i += 1
             continue
 
         # section headers trigger table parsing
         # helpers return (parsed_data, updated_index) tuples
-        if line.lower().startswith("## compute layers"):
-            layers, i = _parse_layers_table(lines, i + 1)
-            continue
-
-        if line.lower().startswith("## database"):
-            db_settings, i = _parse_kv_table(lines, i + 1)
-            continue
-
-        if line.lower().startswith("## cache"):
-            cache_settings, i = _parse_kv_table(lines, i + 1)
-            continue
+        if head.startswith("## "):
+            if head.startswith("## compute layers"):
+                layers, i = _parse_layers_table(lines, i + 1)
+                have |= _HAVE_LAYERS
+                continue
+
+            if head.startswith("## database"):
+                db_settings, i = _parse_kv_table(lines, i + 1)
+                have |= _HAVE_DB
+                continue
+
+            if head.startswith("## cache"):
+                cache_settings, i = _parse_kv_table(lines, i + 1)
+                have |= _HAVE_CACHE
+                continue
 
         # unrecognized line - skip and continue
         i += 1
@@ -82,9 +150,11 @@ def parse_cell_spec(path: Path) -> CellSpec:
     if not cell_name:
         raise CellSpecError("Missing Cell title line (expected '# <name> Cell').")
 
+    realm_name = metadata.get("realm_name")
     if not realm_name:
         raise CellSpecError("Missing 'Realm:' line.")
 
+    region = metadata.get("region")
     if not region:
         raise CellSpecError("Missing 'Region:' line.")
 
@@ -93,9 +163,10 @@ def parse_cell_spec(path: Path) -> CellSpec:
         raise CellSpecError("No compute layers found under '## Compute Layers'.")
 
     # enforce fixed 4-layer architecture: kernel, platform, gateway, apps
-    required_layers = {"kernel", "platform", "gateway", "apps"}
-    found_layers = {layer.name.lower() for layer in layers}
-    missing = required_layers - found_layers
+    # names were lowercased at parse time, so the dict keys double as the
+    # found-layer set - no re-lowering pass needed
+    layers_by_name = {layer.name: layer for layer in layers}
+    missing = _REQUIRED_LAYERS - layers_by_name.keys()
     if missing:
         raise CellSpecError(f"Missing required compute layers: {', '.join(sorted(missing))}.")
 
@@ -131,11 +202,6 @@ def parse_cell_spec(path: Path) -> CellSpec:
     except ValueError as exc:
         raise CellSpecError("Cache 'nodes' must be an integer.") from exc
 
-    cache = CacheSpec(
-        node_type=cache_settings["node_type"],
-        nodes=int(cache_settings["nodes"]),
-    )
-
     # assemble final CellSpec object with all parsed components
     cell = CellSpec(
         cell_name=cell_name,
@@ -170,82 +236,102 @@ def _parse_cell_name_from_title(line: str) -> str:
     return title
 
 
-def _parse_layers_table(lines: List[str], start: int) -> tuple[List[LayerSpec], int]:
+def _scan_table_rows(lines: List[str], start: int, table_label: str) -> tuple[List[List[str]], int]:
     """
-    Parse compute layers markdown table into LayerSpec objects.
-
-    Expected format:
-        | Layer    | vCPU | Memory MB | Tasks |
-        |----------|------|-----------|-------|
-        | kernel   | 256  | 512       | 2     |
-        | platform | 512  | 1024      | 2     |
-
-    Returns: (list of LayerSpec objects, updated line index)
-    Raises: CellSpecError if table malformed or data invalid
+    Shared table walker for the layers and kv parsers.
+
+    Skips blanks after the section header, consumes the header and
+    separator rows, then collects each data row pre-split on pipes.
+    The leading pipe yields an empty parts[0], so columns start at
+    parts[1]; maxsplit 6 covers both table shapes. One code object on
+    the hot path instead of two near-identical loops. Expects lines
+    already stripped by the caller, so revisited entries cost no
+    fresh allocation.
+
+    Returns: (list of per-row parts lists, updated line index)
+    Raises: CellSpecError (prefixed with table_label) if structure invalid
     """
     i = start
     n = len(lines)
 
     # skip blank lines between section header and table
-    while i < n and not lines[i].strip():
+    while i < n and not lines[i]:
         i += 1
 
     # verify header row present (must start with |)
-    if i >= n or not lines[i].strip().startswith("|"):
-        raise CellSpecError("Compute Layers table header row is missing or malformed.")
+    if i >= n or not lines[i].startswith("|"):
+        raise CellSpecError(f"{table_label} table header row is missing or malformed.")
     i += 1
 
     # verify separator row present (markdown table format)
-    if i >= n or not lines[i].strip().startswith("|"):
-        raise CellSpecError("Compute Layers table separator row is missing.")
+    if i >= n or not lines[i].startswith("|"):
+        raise CellSpecError(f"{table_label} table separator row is missing.")
     i += 1
 
-    layers: List[LayerSpec] = []
+    rows: List[List[str]] = []
 
-    # parse data rows until non-table line encountered
+    # collect data rows until non-table line encountered
     while i < n:
-        line = lines[i].strip()
+        line = lines[i]
 
         # stop at first non-table line (no pipe or empty)
         if not line or not line.startswith("|"):
             break
 
-        # skip additional separator rows (shouldn't happen but defensive)
-        if set(line.replace("|", "").strip()) <= {"-", ":"}:
-            i += 1
-            continue
+        rows.append(line.split("|", 6))
+        i += 1
+
+    return rows, i
 
-        # split row on pipes, remove outer pipes and whitespace
-        # example: "| kernel | 256 | 512 | 2 |" → ["kernel", "256", "512", "2"]
-        cells = [c.strip() for c in line.strip("|").split("|")]
+
+def _parse_layers_table(lines: List[str], start: int) -> tuple[List[LayerSpec], int]:
+    """
+    Parse compute layers markdown table into LayerSpec objects.
+
+    Expected format:
+        | Layer    | vCPU | Memory MB | Tasks |
+        |----------|------|-----------|-------|
+        | kernel   | 256  | 512       | 2     |
+        | platform | 512  | 1024      | 2     |
+
+    Returns: (list of LayerSpec objects, updated line index)
+    Raises: CellSpecError if table malformed or data invalid
+    """
+    rows, i = _scan_table_rows(lines, start, "Compute Layers")
+
+    layers: List[LayerSpec] = []
+
+    for parts in rows:
+        # the 4 columns we keep live at parts[1:5] (extra columns ignored)
+        # example: "| kernel | 256 | 512 | 2 |" → ["", " kernel ", " 256 ", " 512 ", " 2 ", ""]
 
         # enforce minimum 4 columns: Layer, vCPU, Memory MB, Tasks
-        if len(cells) < 4:
+        if len(parts) < 5:
             raise CellSpecError("Compute Layers row must have at least 4 columns.")
 
-        # extract first 4 columns (ignore extra columns if present)
-        name, vcpu_str, mem_str, tasks_str = cells[:4]
-
         # convert numeric strings to integers, fail-fast on invalid input
+        # int() tolerates surrounding whitespace, so no per-cell strip needed
         try:
-            vcpu = int(vcpu_str)
-            memory_mb = int(mem_str)
-            tasks = int(tasks_str)
+            vcpu = int(parts[2])
+            memory_mb = int(parts[3])
+            tasks = int(parts[4])
         except ValueError as exc:
-            raise CellSpecError(f"Invalid numeric values in compute layer row: {line}") from exc
+            raise CellSpecError(
+                f"Invalid numeric values in compute layer row: {'|'.join(parts)}"
+            ) from exc
 
         # create LayerSpec object, normalize layer name to lowercase
+        # interning makes later lookups against _REQUIRED_LAYERS and the
+        # layers_by_name dict a pointer comparison
         layers.append(
             LayerSpec(
-                name=name.lower(),
+                name=sys.intern(parts[1].strip().lower()),
                 vcpu=vcpu,
                 memory_mb=memory_mb,
                 tasks=tasks,
             )
         )
 
-        i += 1
-
     return layers, i
 
 
@@ -262,56 +348,26 @@ def _parse_kv_table(lines: List[str], start: int) -> tuple[Dict[str, str], int]:
     Returns: (dict mapping lowercase keys to values, updated line index)
     Raises: CellSpecError if table structure invalid
     """
-    i = start
-    n = len(lines)
-
-    # skip blank lines between section header and table
-    while i < n and not lines[i].strip():
-        i += 1
-
-    # verify header row present
-    if i >= n or not lines[i].strip().startswith("|"):
-        raise CellSpecError("Key value table header row is missing or malformed.")
-    i += 1
-
-    # verify separator row present
-    if i >= n or not lines[i].strip().startswith("|"):
-        raise CellSpecError("Key value table separator row is missing.")
-    i += 1
+    rows, i = _scan_table_rows(lines, start, "Key value")
 
     result: Dict[str, str] = {}
 
-    # parse data rows until non-table line encountered
-    while i < n:
-        line = lines[i].strip()
-
-        # stop at first non-table line
-        if not line or not line.startswith("|"):
-            break
-
-        # skip separator rows (defensive, shouldn't occur in data section)
-        if set(line.replace("|", "").strip()) <= {"-", ":"}:
-            i += 1
-            continue
-
-        # split row on pipes: "| instance_class | db.t3.small |" → ["instance_class", "db.t3.small"]
-        cells = [c.strip() for c in line.strip("|").split("|")]
+    for parts in rows:
+        # key and value sit at parts[1] and parts[2] - only those two
+        # get stripped
+        # example: "| instance_class | db.t3.small |" → ["", " instance_class ", " db.t3.small ", ""]
 
         # enforce minimum 2 columns for key-value pairs
-        if len(cells) < 2:
-            raise CellSpecError(f"Key value row must have at least 2 columns: {line}")
+        if len(parts) < 3:
+            raise CellSpecError(f"Key value row must have at least 2 columns: {'|'.join(parts)}")
 
-        # extract key and value from first two columns
-        key, value = cells[0], cells[1]
-
-        # normalize key to lowercase for case-insensitive lookups
-        key = key.strip().lower()
+        # normalize key to lowercase for case-insensitive lookups;
+        # interned so the known-key membership checks compare by pointer
+        key = sys.intern(parts[1].strip().lower())
 
         # only add non-empty keys (skip malformed rows)
         if key:
-            result[key] = value.strip()
-
-        i += 1
+            result[key] = parts[2].strip()
 
     return result, i
 
@@ -324,19 +380,24 @@ def _validate_cell_spec_numbers(cell: CellSpec) -> None:
 
     Raises: CellSpecError with specific field name if any value <= 0
     """
-    # validate each compute layer's resource values
-    for layer in cell.layers:
-        # vCPU must be positive (e.g., 256, 512)
-        if layer.vcpu <= 0:
-            raise CellSpecError(f"Layer '{layer.name}' vCPU must be positive.")
-
-        # memory_mb must be positive (e.g., 512, 1024)
-        if layer.memory_mb <= 0:
-            raise CellSpecError(f"Layer '{layer.name}' memory_mb must be positive.")
-
-        # tasks must be positive (e.g., 1, 2, 4)
-        if layer.tasks <= 0:
-            raise CellSpecError(f"Layer '{layer.name}' tasks must be positive.")
+    # validate each compute layer's resource values in one fused scan:
+    # a single generator walks (field, value) pairs and stops at the first
+    # offender, so the all-valid case runs without Python-level branching
+    bad = next(
+        (
+            (layer.name, field_name, value)
+            for layer in cell.layers
+            for field_name, value in (
+                ("vCPU", layer.vcpu),
+                ("memory_mb", layer.memory_mb),
+                ("tasks", layer.tasks),
+            )
+            if value <= 0
+        ),
+        None,
+    )
+    if bad:
+        raise CellSpecError(f"Layer '{bad[0]}' {bad[1]} must be positive.")
 
     # validate database storage (must provision some storage)
     if cell.database.storage_gb <= 0: